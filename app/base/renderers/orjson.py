@@ -4,11 +4,9 @@
 
 # Didn't pip install because https://github.com/brianjbuck/drf_orjson_renderer/issues/20
 
-import functools
-import operator
 import uuid
 from decimal import Decimal
-from typing import Any, Optional
+from typing import Any, Callable, Iterable, Optional
 
 import orjson
 from django.utils.functional import Promise
@@ -18,6 +16,53 @@ from rest_framework.settings import api_settings
 __all__ = ['ORJSONRenderer']
 
 
+def _decimal_to_native(obj: Decimal) -> str | float:
+    if api_settings.COERCE_DECIMAL_TO_STRING:
+        return str(obj)
+    return float(obj)
+
+
+# orjson serializes dict and list subclasses natively, so only objects which
+# pretend to be one (e.g. `SimpleLazyObject`) get here and must be unwrapped
+def _dict_to_native(obj: dict) -> dict:
+    return {**obj}
+
+
+def _list_to_native(obj: list) -> list:
+    return [*obj]
+
+
+def _resolve_converter(obj: Any) -> Optional[Callable[[Any], Any]]:
+    if isinstance(obj, dict):
+        return _dict_to_native
+    elif isinstance(obj, list):
+        return _list_to_native
+    elif isinstance(obj, Decimal):
+        return _decimal_to_native
+    elif isinstance(obj, (str, uuid.UUID, Promise)):
+        return str
+    # look up on the type: the converter is cached per type and it avoids the
+    # exception swallowing of `hasattr`
+    tolist = getattr(type(obj), 'tolist', None)
+    if tolist is not None:
+        return tolist
+    if getattr(type(obj), '__iter__', None) is not None:
+        return list
+    return None
+
+
+def _combine_options(seed: int, flags: Iterable[int]) -> int:
+    for flag in flags:
+        seed |= flag
+    return seed
+
+
+# exact type -> converter; other types are memoized on the first miss
+_CONVERTERS: dict[type, Callable[[Any], Any]] = {Decimal: _decimal_to_native}
+# protects against unbounded growth from arbitrary runtime types
+_CONVERTERS_MAX_SIZE = 256
+
+
 class ORJSONRenderer(BaseRenderer):
     """
     Renderer which serializes to JSON.
@@ -29,10 +74,12 @@ class ORJSONRenderer(BaseRenderer):
     json_media_type: str = "application/json"
     media_type: str = json_media_type
 
-    options = functools.reduce(
-        operator.or_,
+    # datetimes, dates, times, UUIDs and dataclasses are serialized natively by
+    # orjson and never reach `default`; naive datetimes are treated as UTC,
+    # which is the project TIME_ZONE
+    options = _combine_options(
+        orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC,
         api_settings.user_settings.get('ORJSON_RENDERER_OPTIONS', ()),
-        orjson.OPT_SERIALIZE_NUMPY,
     )
 
     @staticmethod
@@ -43,23 +90,23 @@ class ORJSONRenderer(BaseRenderer):
         native Python equivalent.
         :param obj: Object of any type to be converted.
         :return: native python object
+        :raise TypeError: if there is no known conversion for the object type, as
+                orjson itself does
         """
 
-        if isinstance(obj, dict):
-            return dict(obj)
-        elif isinstance(obj, list):
-            return list(obj)
-        elif isinstance(obj, Decimal):
-            if api_settings.COERCE_DECIMAL_TO_STRING:
-                return str(obj)
-            else:
-                return float(obj)
-        elif isinstance(obj, (str, uuid.UUID, Promise)):
-            return str(obj)
-        elif hasattr(obj, 'tolist'):
-            return obj.tolist()
-        elif hasattr(obj, '__iter__'):
-            return list(item for item in obj)
+        converter = _CONVERTERS.get(type(obj))
+        if converter is None:
+            converter = _resolve_converter(obj)
+            if converter is None:
+                raise TypeError(
+                    f'Object of type {type(obj).__name__} is not JSON serializable'
+                )
+            # lazy proxies (e.g. `SimpleLazyObject`) report the wrapped type via
+            # `__class__`, so their converter depends on the instance, not the type
+            cacheable = obj.__class__ is type(obj)
+            if cacheable and len(_CONVERTERS) < _CONVERTERS_MAX_SIZE:
+                _CONVERTERS[type(obj)] = converter
+        return converter(obj)
 
     def render(
         self,
@@ -70,6 +117,8 @@ class ORJSONRenderer(BaseRenderer):
         """
         Serializes Python objects to JSON.
         :param data: The response data, as set by the Response() instantiation.
+                Already serialized JSON (bytes, bytearray or memoryview, e.g. a
+                cached payload) is returned as is without re-serialization.
         :param media_type: If provided, this is the accepted media type, of the
                 `Accept` HTTP header.
         :param renderer_context: If provided, this is a dictionary of contextual
@@ -79,9 +128,20 @@ class ORJSONRenderer(BaseRenderer):
         """
         if data is None:
             return b''
+        if isinstance(data, (bytes, bytearray)):
+            return bytes(data)
+        if isinstance(data, memoryview):
+            return data.tobytes()
 
         renderer_context = renderer_context or {}
 
+        # If `indent` is provided in the context, then pretty print the result.
+        # E.g. If we're being called by RestFramework's BrowsableAPIRenderer.
+        if media_type == self.html_media_type:
+            options = self.options | orjson.OPT_INDENT_2
+        else:
+            options = self.options
+
         # By default, this function will use its own version of `default()` in
         # order to safely serialize known Django types like QuerySets. If you
         # know you won't need this you can pass `None` to the renderer_context
@@ -101,11 +161,5 @@ class ORJSONRenderer(BaseRenderer):
         else:
             default = renderer_context['default_function']
 
-        # If `indent` is provided in the context, then pretty print the result.
-        # E.g. If we're being called by RestFramework's BrowsableAPIRenderer.
-        options = self.options
-        if media_type == self.html_media_type:
-            options |= orjson.OPT_INDENT_2
-
         serialized: bytes = orjson.dumps(data, default=default, option=options)
         return serialized
@@ -1,5 +1,7 @@
+from decimal import Decimal
 from typing import Any
 
+from django.db import models
 from drf_spectacular.utils import OpenApiResponse
 from rest_framework import serializers
 from rest_framework.validators import UniqueValidator
@@ -7,6 +9,19 @@ from rest_framework.validators import UniqueValidator
 import app.base.exceptions
 
 
+class DecimalField(serializers.DecimalField):
+    """
+    Returns float instead of Decimal when not coercing to string, so the renderer
+    does not have to convert every value through its `default` callback.
+    """
+
+    def to_representation(self, value):
+        value = super().to_representation(value)
+        if isinstance(value, Decimal):
+            return float(value)
+        return value
+
+
 class BaseSerializer(serializers.Serializer):
     WARNINGS: dict[Any, 'app.base.exceptions.APIWarning'] = {}
     _DESCRIPTION = None
@@ -34,6 +49,10 @@ class BaseSerializer(serializers.Serializer):
 class BaseModelSerializer(serializers.ModelSerializer, BaseSerializer):
     Meta: type
 
+    serializer_field_mapping = serializers.ModelSerializer.serializer_field_mapping | {
+        models.DecimalField: DecimalField
+    }
+
     def is_valid(self, raise_exception=True):
         return super().is_valid(raise_exception)
 
@@ -15,6 +15,7 @@ class BaseTest(APITestCase):
     assert_is_instance = APITestCase.assertIsInstance
     assert_is_none = APITestCase.assertIsNone
     assert_is_not_none = APITestCase.assertIsNotNone
+    assert_raises = APITestCase.assertRaises
 
     def assert_json(self, json: dict, exp_json: dict):
         def dfs(inner_json, inner_exp_json):
@@ -0,0 +1,69 @@
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from uuid import UUID
+
+from django.utils.functional import SimpleLazyObject
+
+from app.base.renderers import ORJSONRenderer
+from app.base.tests.base import BaseTest
+
+
+class ORJSONRendererTest(BaseTest):
+    renderer = ORJSONRenderer()
+
+    def test_none(self):
+        self.assert_equal(self.renderer.render(None), b'')
+
+    def test_dict(self):
+        self.assert_equal(self.renderer.render({'a': [1, 'b']}), b'{"a":[1,"b"]}')
+
+    def test_html(self):
+        self.assert_equal(
+            self.renderer.render({'a': 1}, 'text/html'), b'{\n  "a": 1\n}'
+        )
+
+    def test_bytes(self):
+        self.assert_equal(self.renderer.render(b'{"a":1}'), b'{"a":1}')
+
+    def test_bytearray(self):
+        self.assert_equal(self.renderer.render(bytearray(b'[1,2]')), b'[1,2]')
+
+    def test_memoryview(self):
+        self.assert_equal(self.renderer.render(memoryview(b'"a"')), b'"a"')
+
+    def test_naive_datetime(self):
+        self.assert_equal(
+            self.renderer.render(datetime(2022, 1, 2, 3, 4, 5)),
+            b'"2022-01-02T03:04:05+00:00"',
+        )
+
+    def test_aware_datetime(self):
+        self.assert_equal(
+            self.renderer.render(
+                datetime(2022, 1, 2, 3, 4, 5, tzinfo=timezone(timedelta(hours=3)))
+            ),
+            b'"2022-01-02T03:04:05+03:00"',
+        )
+
+    def test_known_types(self):
+        self.assert_equal(
+            self.renderer.render(
+                {
+                    'dict': SimpleLazyObject(lambda: {'a': 1}),
+                    'list': SimpleLazyObject(lambda: [1, 2]),
+                    'decimal': Decimal('1.50'),
+                    'uuid': UUID(int=1),
+                    'iterable': (i for i in range(2)),
+                }
+            ),
+            b'{"dict":{"a":1},"list":[1,2],"decimal":"1.50",'
+            b'"uuid":"00000000-0000-0000-0000-000000000001","iterable":[0,1]}',
+        )
+
+    def test_timedelta(self):
+        with self.assert_raises(TypeError):
+            self.renderer.render({'a': timedelta(seconds=1)})
+
+    def test_unknown_object(self):
+        with self.assert_raises(TypeError):
+            self.renderer.render({'a': object()})
@@ -0,0 +1,44 @@
+from decimal import Decimal
+
+from django.db import models
+
+from app.base.serializers.base import BaseModelSerializer, DecimalField
+from app.base.tests.base import BaseTest
+
+
+class DecimalModel(models.Model):
+    price = models.DecimalField(max_digits=5, decimal_places=2)
+
+    class Meta:
+        app_label = 'base'
+        managed = False
+
+
+class _DecimalSerializer(BaseModelSerializer):
+    class Meta:
+        model = DecimalModel
+        fields = ['price']
+
+
+class _FloatDecimalSerializer(BaseModelSerializer):
+    class Meta:
+        model = DecimalModel
+        fields = ['price']
+        extra_kwargs = {'price': {'coerce_to_string': False}}
+
+
+class BaseModelSerializerTest(BaseTest):
+    instance = DecimalModel(price=Decimal('1.50'))
+
+    def test_decimal_field_mapping(self):
+        self.assert_is_instance(_DecimalSerializer().fields['price'], DecimalField)
+
+    def test_decimal_coerce_to_string(self):
+        price = _DecimalSerializer(self.instance).data['price']
+        self.assert_is_instance(price, str)
+        self.assert_equal(price, '1.50')
+
+    def test_decimal_not_coerce_to_string(self):
+        price = _FloatDecimalSerializer(self.instance).data['price']
+        self.assert_is_instance(price, float)
+        self.assert_equal(price, 1.5)
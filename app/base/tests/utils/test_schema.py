@@ -0,0 +1,100 @@
+from drf_spectacular.generators import SchemaGenerator
+from drf_spectacular.openapi import AutoSchema
+from drf_spectacular.utils import OpenApiParameter
+from rest_framework import serializers
+from rest_framework.decorators import action
+from rest_framework.routers import SimpleRouter
+from rest_framework.viewsets import ViewSet
+
+from app.base.tests.base import BaseTest
+from app.base.utils.schema import extend_schema
+
+
+class _Serializer(serializers.Serializer):
+    id = serializers.IntegerField()
+
+
+class _MySchema(AutoSchema):
+    def get_tags(self):
+        return ['my']
+
+
+class _StackedViewSet(ViewSet):
+    serializer_class = _Serializer
+
+    @extend_schema(tags=['outer'], parameters=[OpenApiParameter('outer', int)])
+    @extend_schema(
+        tags=['inner'], summary='inner', parameters=[OpenApiParameter('inner', int)]
+    )
+    def list(self, request):
+        pass
+
+
+@extend_schema(tags=['cls'], description='cls')
+class _ClassViewSet(ViewSet):
+    serializer_class = _Serializer
+
+    def list(self, request):
+        pass
+
+    @extend_schema(summary='method')
+    @action(detail=False)
+    def method(self, request):
+        pass
+
+    @extend_schema(tags=['method'])
+    @action(detail=False)
+    def method_tags(self, request):
+        pass
+
+    @extend_schema(summary='custom')
+    @action(detail=False, schema=_MySchema())
+    def custom(self, request):
+        pass
+
+
+class ExtendSchemaTest(BaseTest):
+    _schema = None
+
+    @classmethod
+    def get_schema(cls) -> dict:
+        if cls._schema is None:
+            router = SimpleRouter()
+            router.register('stacked', _StackedViewSet, basename='stacked')
+            router.register('class', _ClassViewSet, basename='class')
+            cls._schema = SchemaGenerator(patterns=router.urls).get_schema(
+                request=None, public=True
+            )
+        return cls._schema
+
+    def get_operation(self, path: str) -> dict:
+        return self.get_schema()['paths'][path]['get']
+
+    def test_stacked(self):
+        operation = self.get_operation('/stacked/')
+        self.assert_equal(operation['tags'], ['outer'])
+        self.assert_equal(operation['summary'], 'inner')
+        self.assert_equal(
+            {parameter['name'] for parameter in operation['parameters']},
+            {'inner', 'outer'},
+        )
+
+    def test_class(self):
+        operation = self.get_operation('/class/')
+        self.assert_equal(operation['tags'], ['cls'])
+        self.assert_equal(operation['description'], 'cls')
+
+    def test_class_and_method(self):
+        operation = self.get_operation('/class/method/')
+        self.assert_equal(operation['tags'], ['cls'])
+        self.assert_equal(operation['summary'], 'method')
+        self.assert_equal(operation['description'], 'cls')
+
+    def test_method_overrides_class(self):
+        operation = self.get_operation('/class/method_tags/')
+        self.assert_equal(operation['tags'], ['method'])
+
+    def test_method_custom_schema_overrides_class(self):
+        operation = self.get_operation('/class/custom/')
+        self.assert_equal(operation['tags'], ['my'])
+        self.assert_equal(operation['summary'], 'custom')
@@ -1,4 +1,8 @@
 import inspect
+import weakref
+from dataclasses import dataclass
+from dataclasses import fields as dataclass_fields
+from functools import partialmethod
 from typing import Any, Callable, Dict, List, Optional, Type, TypeVar
 
 from drf_spectacular.drainage import error, get_view_method_names, isolate_view_method
@@ -26,13 +30,221 @@ _F = TypeVar('_F', bound=Callable[..., Any])
 def _delete_none(f):
     def _decorator(*args, **kwargs):
         res = f(*args, **kwargs)
-        if isinstance(res, dict):
+        if isinstance(res, dict) and any(v is None for v in res.values()):
+            # copy instead of deleting in place: `res` may be the `responses` dict
+            # passed to @extend_schema, which is shared between calls
             res = {k: v for k, v in res.items() if v is not None}
         return res
 
     return _decorator
 
 
+_FALSY_MEANINGFUL_FIELDS = {'request', 'responses', 'tags', 'filters', 'operation'}
+
+
+@dataclass(frozen=True, eq=False, slots=True)
+class _SchemaExtension:
+    """
+    Arguments of a single @extend_schema application.
+    """
+
+    operation_id: Optional[str] = None
+    parameters: Optional[List[OpenApiParameter]] = None
+    request: Any = empty
+    responses: Any = empty
+    auth: Optional[List[str]] = None
+    description: Optional[str] = None
+    summary: Optional[str] = None
+    deprecated: Optional[bool] = None
+    tags: Optional[List[str]] = None
+    filters: Optional[bool] = None
+    exclude: bool = False
+    operation: Optional[Dict] = None
+    methods: Optional[List[str]] = None
+    versions: Optional[List[str]] = None
+    examples: Optional[List[OpenApiExample]] = None
+    extensions: Optional[Dict[str, Any]] = None
+
+    def get_applied_fields(self) -> set[str]:
+        """
+        Names of the fields that take effect, i.e. are truthy, or set at all for
+        fields where a falsy value is meaningful (e.g. `tags=[]`).
+        """
+        applied = set()
+        for field in dataclass_fields(self):
+            value = getattr(self, field.name)
+            if field.name in _FALSY_MEANINGFUL_FIELDS:
+                if value is not field.default:
+                    applied.add(field.name)
+            elif value:
+                applied.add(field.name)
+        return applied
+
+    def is_in_scope(self, schema) -> bool:
+        # the schema instance may be shared between views (see `f.schema` in
+        # extend_schema), so the result is only reused for the same view and method
+        view, method = schema.view, schema.method
+        cache = schema.__dict__.setdefault('_in_scope_cache', {})
+        cached = cache.get(self)
+        if cached is not None and cached[0]() is view and cached[1] == method:
+            return cached[2]
+        version, _ = view.determine_version(view.request, **view.kwargs)
+        version_scope = self.versions is None or version in self.versions
+        method_scope = self.methods is None or method in self.methods
+        in_scope = method_scope and version_scope
+        # weakref like `ViewInspector.view`: the cache must not keep the view alive
+        cache[self] = (weakref.ref(view), method, in_scope)
+        return in_scope
+
+
+# default success status for methods whose status is not 200
+_METHOD_STATUS = {'POST': 201, 'DELETE': 204}
+
+
+# Overrides of the schema accessors, shared by all the classes created by
+# @extend_schema. Each one is bound to its class `cls` with `partialmethod`, applies
+# only `cls._schema_extension` and otherwise defers to `super(cls, self)`, so the
+# extensions stay interleaved with the other schema classes of the MRO.
+
+
+def _get_operation(self, cls, path, path_regex, path_prefix, method_, registry):
+    setattr(self, 'method', method_.upper())
+    extension = cls._schema_extension
+    if extension.exclude and extension.is_in_scope(self):
+        return None
+    if extension.operation is not None and extension.is_in_scope(self):
+        return extension.operation
+    return super(cls, self).get_operation(
+        path, path_regex, path_prefix, method_, registry
+    )
+
+
+def _get_operation_id(self, cls):
+    extension = cls._schema_extension
+    if extension.is_in_scope(self):
+        return extension.operation_id
+    return super(cls, self).get_operation_id()
+
+
+def _get_override_parameters(self, cls):
+    extension = cls._schema_extension
+    if extension.is_in_scope(self):
+        return super(cls, self).get_override_parameters() + extension.parameters
+    return super(cls, self).get_override_parameters()
+
+
+def _get_auth(self, cls):
+    extension = cls._schema_extension
+    if extension.is_in_scope(self):
+        return extension.auth
+    return super(cls, self).get_auth()
+
+
+def _get_examples(self, cls):
+    extension = cls._schema_extension
+    if extension.is_in_scope(self):
+        return super(cls, self).get_examples() + extension.examples
+    return super(cls, self).get_examples()
+
+
+def _get_request_serializer(self, cls):
+    extension = cls._schema_extension
+    if extension.is_in_scope(self):
+        return extension.request
+    return super(cls, self).get_request_serializer()
+
+
+@_delete_none
+def _get_response_serializers(self, cls):
+    super_responses = super(cls, self).get_response_serializers()
+    extension = cls._schema_extension
+    responses = extension.responses
+    if extension.is_in_scope(self):
+        if isinstance(responses, dict):
+            if isinstance(super_responses, dict):
+                if not responses:
+                    return super_responses
+                return {**super_responses, **responses}
+            elif isinstance(super_responses, Serializer):
+                status = _METHOD_STATUS.get(self.method, 200)
+                return {status: super_responses, **responses}
+        return responses
+    return super_responses
+
+
+def _get_description(self, cls):
+    extension = cls._schema_extension
+    if extension.is_in_scope(self):
+        return extension.description
+    return super(cls, self).get_description()
+
+
+def _get_summary(self, cls):
+    extension = cls._schema_extension
+    if extension.is_in_scope(self):
+        return str(extension.summary)
+    return super(cls, self).get_summary()
+
+
+def _is_deprecated(self, cls):
+    extension = cls._schema_extension
+    if extension.is_in_scope(self):
+        return extension.deprecated
+    return super(cls, self).is_deprecated()
+
+
+def _get_tags(self, cls):
+    extension = cls._schema_extension
+    if extension.is_in_scope(self):
+        return extension.tags
+    return super(cls, self).get_tags()
+
+
+def _get_extensions(self, cls):
+    extension = cls._schema_extension
+    if extension.is_in_scope(self):
+        return extension.extensions
+    return super(cls, self).get_extensions()
+
+
+def _get_filter_backends(self, cls):
+    extension = cls._schema_extension
+    if extension.is_in_scope(self):
+        if extension.filters:
+            return getattr(self.view, 'filter_backends', [])
+        return []
+    return super(cls, self).get_filter_backends()
+
+
+# schema accessor -> its override and the `_SchemaExtension` fields it depends on
+_OVERRIDES = {
+    'get_operation': (_get_operation, ('exclude', 'operation')),
+    'get_operation_id': (_get_operation_id, ('operation_id',)),
+    'get_override_parameters': (_get_override_parameters, ('parameters',)),
+    'get_auth': (_get_auth, ('auth',)),
+    'get_examples': (_get_examples, ('examples',)),
+    'get_request_serializer': (_get_request_serializer, ('request',)),
+    'get_response_serializers': (_get_response_serializers, ('responses',)),
+    'get_description': (_get_description, ('description',)),
+    'get_summary': (_get_summary, ('summary',)),
+    'is_deprecated': (_is_deprecated, ('deprecated',)),
+    'get_tags': (_get_tags, ('tags',)),
+    'get_extensions': (_get_extensions, ('extensions',)),
+    'get_filter_backends': (_get_filter_backends, ('filters',)),
+}
+
+
+def _extend_schema_class(base: type, extension: _SchemaExtension) -> type:
+    cls = type('ExtendedSchema', (base,), {'_schema_extension': extension})
+    applied_fields = extension.get_applied_fields()
+    # accessors that the extension doesn't affect are inherited as is, so the
+    # overrides only have to check the scope
+    for name, (override, fields) in _OVERRIDES.items():
+        if not applied_fields.isdisjoint(fields):
+            setattr(cls, name, partialmethod(override, cls))
+    return cls
+
+
 # taken from drf_spectacular.utils.extend_schema
 def extend_schema(
     operation_id: Optional[str] = None,
@@ -106,6 +318,25 @@ def extend_schema(
     if methods is not None:
         methods = [method.upper() for method in methods]
 
+    extension = _SchemaExtension(
+        operation_id=operation_id,
+        parameters=parameters,
+        request=request,
+        responses=responses,
+        auth=auth,
+        description=description,
+        summary=summary,
+        deprecated=deprecated,
+        tags=tags,
+        filters=filters,
+        exclude=exclude,
+        operation=operation,
+        methods=methods,
+        versions=versions,
+        examples=examples,
+        extensions=extensions,
+    )
+
     def decorator(f):
         BaseSchema = (
             # explicit manually set schema or previous view annotation
@@ -121,103 +352,7 @@ def extend_schema(
         if not inspect.isclass(BaseSchema):
             BaseSchema = BaseSchema.__class__
 
-        def is_in_scope(ext_schema):
-            version, _ = ext_schema.view.determine_version(
-                ext_schema.view.request, **ext_schema.view.kwargs
-            )
-            version_scope = versions is None or version in versions
-            method_scope = methods is None or ext_schema.method in methods
-            return method_scope and version_scope
-
-        class ExtendedSchema(BaseSchema):
-            _method__status = {
-                'GET': 200,
-                'POST': 201,
-                'PUT': 200,
-                'PATCH': 200,
-                'DELETE': 204,
-                'HEAD': 200,
-                'OPTIONS': 200,
-                'TRACE': 200,
-            }
-
-            def get_operation(self, path, path_regex, path_prefix, method_, registry):
-                setattr(self, 'method', method_.upper())
-                if exclude and is_in_scope(self):
-                    return None
-                if operation is not None and is_in_scope(self):
-                    return operation
-                return super().get_operation(
-                    path, path_regex, path_prefix, method_, registry
-                )
-
-            def get_operation_id(self):
-                if operation_id and is_in_scope(self):
-                    return operation_id
-                return super().get_operation_id()
-
-            def get_override_parameters(self):
-                if parameters and is_in_scope(self):
-                    return super().get_override_parameters() + parameters
-                return super().get_override_parameters()
-
-            def get_auth(self):
-                if auth and is_in_scope(self):
-                    return auth
-                return super().get_auth()
-
-            def get_examples(self):
-                if examples and is_in_scope(self):
-                    return super().get_examples() + examples
-                return super().get_examples()
-
-            def get_request_serializer(self):
-                if request is not empty and is_in_scope(self):
-                    return request
-                return super().get_request_serializer()
-
-            @_delete_none
-            def get_response_serializers(self):
-                super_responses = super().get_response_serializers()
-                if responses is not empty and is_in_scope(self):
-                    if isinstance(responses, dict):
-                        if isinstance(super_responses, dict):
-                            return super_responses | responses
-                        elif isinstance(super_responses, Serializer):
-                            status = self._method__status[self.method]
-                            return {status: super_responses} | responses
-                    return responses
-                return super_responses
-
-            def get_description(self):
-                if description and is_in_scope(self):
-                    return description
-                return super().get_description()
-
-            def get_summary(self):
-                if summary and is_in_scope(self):
-                    return str(summary)
-                return super().get_summary()
-
-            def is_deprecated(self):
-                if deprecated and is_in_scope(self):
-                    return deprecated
-                return super().is_deprecated()
-
-            def get_tags(self):
-                if tags is not None and is_in_scope(self):
-                    return tags
-                return super().get_tags()
-
-            def get_extensions(self):
-                if extensions and is_in_scope(self):
-                    return extensions
-                return super().get_extensions()
-
-            def get_filter_backends(self):
-                if filters is not None and is_in_scope(self):
-                    return getattr(self.view, 'filter_backends', []) if filters else []
-                return super().get_filter_backends()
+        ExtendedSchema = _extend_schema_class(BaseSchema, extension)
 
         if inspect.isclass(f):
             # either direct decoration of views, or unpacked @api_view from
@@ -232,12 +367,13 @@ def extend_schema(
             # reorder schema class MRO so that view method annotation takes precedence
             # over view class annotation. only relevant if there is a method annotation
             for view_method_name in get_view_method_names(view=f, schema=BaseSchema):
-                if 'schema' not in getattr(getattr(f, view_method_name), 'kwargs', {}):
+                method_kwargs = getattr(getattr(f, view_method_name), 'kwargs', None)
+                if not method_kwargs or 'schema' not in method_kwargs:
                     continue
-                view_method = isolate_view_method(f, view_method_name)
-                view_method.kwargs['schema'] = type(
+                view_method_kwargs = isolate_view_method(f, view_method_name).kwargs
+                view_method_kwargs['schema'] = type(
                     'ExtendedMetaSchema',
-                    (view_method.kwargs['schema'], ExtendedSchema),
+                    (view_method_kwargs['schema'], ExtendedSchema),
                     {},
                 )
             # persist schema on class to provide annotation to derived view methods.